@@ -0,0 +1,120 @@
+# Copyright 2016, 2023 John J. Rofrano. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Test helpers for configuring and seeding the database
+
+engine_options() returns the SQLAlchemy engine options shared by the test
+suites, ensure_worker_schema() creates the per pytest-xdist worker schema they
+point at, is_postgres() tells whether PostgreSQL only features can be used, and
+copy_seed() streams rows into PostgreSQL with COPY ... FROM STDIN
+which is much faster than INSERT statements when a test needs lots of products
+"""
+import io
+import os
+from datetime import date, datetime
+from enum import Enum
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+
+COPY_COLUMNS = ("name", "description", "price", "available", "category")
+
+
+def is_postgres(database_uri: str) -> bool:
+    """Returns True if the database URI points at PostgreSQL"""
+    return make_url(database_uri).get_backend_name() == "postgresql"
+
+
+def worker_schema() -> str:
+    """Returns the schema for the current pytest-xdist worker, or "" if there is none"""
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    return f"test_{worker}" if worker else ""
+
+
+def ensure_worker_schema(database_uri: str) -> str:
+    """Creates the schema for the current pytest-xdist worker
+
+    Each worker gets its own schema so workers never collide. Nothing is
+    created outside of pytest-xdist or on databases other than PostgreSQL.
+
+    :return: the name of the schema, or "" if none is needed
+    """
+    schema = worker_schema()
+    if not schema or not is_postgres(database_uri):
+        return ""
+    engine = create_engine(database_uri)
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {schema}"))
+    engine.dispose()
+    return schema
+
+
+def engine_options(database_uri: str) -> dict:
+    """Returns the engine options for a test database connection
+
+    Only PostgreSQL needs any options, other databases get an empty dict.
+    Under pytest-xdist the connections use the worker's schema, which must
+    already exist (see ensure_worker_schema).
+    """
+    if not is_postgres(database_uri):
+        return {}
+    # Test data is thrown away, so commits don't wait for the WAL to reach the
+    # disk. This must never be used outside of the tests!
+    server_options = "-c synchronous_commit=off"
+    schema = worker_schema()
+    if schema:
+        server_options += f" -c search_path={schema}"
+    return {
+        "connect_args": {"options": server_options},
+        # let psycopg2 batch executemany() calls into multi-row statements
+        "executemany_mode": "values_plus_batch",
+    }
+
+
+def _format_value_for_copy(value) -> str:
+    """Formats a single value for the COPY text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.name
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def copy_seed(session, products: list):
+    """Inserts products with a single COPY using the session's connection
+
+    The rows are written inside the session's current transaction, so they are
+    rolled back with it. The products are not added to the session and their
+    ids are not populated.
+    """
+    buffer = io.StringIO()
+    for product in products:
+        row = (_format_value_for_copy(getattr(product, column)) for column in COPY_COLUMNS)
+        buffer.write("\t".join(row) + "\n")
+    buffer.seek(0)
+    raw = session.connection().connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY product ({', '.join(COPY_COLUMNS)}) FROM STDIN", buffer
+        )
@@ -28,10 +28,13 @@ import os
 import logging
 from decimal import Decimal
 from unittest import TestCase
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
 from service import app
 from service.common import status
 from service.models import db, init_db, Product
 from tests.factories import ProductFactory
+from tests.helpers import engine_options, ensure_worker_schema, is_postgres
 
 # Disable all but critical errors during normal test run
 # uncomment for debugging failing tests
@@ -58,6 +61,11 @@ class TestProductRoutes(TestCase):
         app.config["DEBUG"] = False
         # Set up the test database
         app.config["SQLALCHEMY_DATABASE_URI"] = DATABASE_URI
+        ensure_worker_schema(DATABASE_URI)
+        options = engine_options(DATABASE_URI)
+        # reuse one database connection for every request instead of a pool
+        options["poolclass"] = StaticPool
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = options
         app.logger.setLevel(logging.CRITICAL)
         init_db(app)
 
@@ -69,7 +77,11 @@ class TestProductRoutes(TestCase):
     def setUp(self):
         """Runs before each test"""
         self.client = app.test_client()
-        db.session.query(Product).delete()  # clean up the last tests
+        # clean up the last tests, TRUNCATE avoids scanning and logging every row
+        if is_postgres(DATABASE_URI):
+            db.session.execute(text(f"TRUNCATE TABLE {Product.__tablename__} RESTART IDENTITY CASCADE"))
+        else:
+            db.session.query(Product).delete()
         db.session.commit()
 
     def tearDown(self):